@@ -161,6 +161,8 @@ Repository: {owner}/{repo}
 class OutputCapture:
     """Captures stdout/stderr while still displaying to console."""
 
+    __slots__ = ('captured_output', 'original_stdout', 'original_stderr')
+
     def __init__(self):
         self.captured_output = []
         self.original_stdout = sys.stdout
@@ -366,30 +368,34 @@ def load_install_script(result_dir: Path) -> Optional[str]:
         return None
 
 
+# Import statement and call expression for each parser in the generated profile
+PARSER_IMPORTS = {
+    'jest': 'from log_parser.parsers.jest import parse_log_jest',
+    'mocha': 'from log_parser.parsers.mocha import parse_log_mocha',
+    'pytest': 'from log_parser.parsers.pytest import parse_log_pytest',
+    'go_test': 'from log_parser.parsers.go_test import parse_log_go_test',
+    'cargo': 'from log_parser.parsers.cargo import parse_log_cargo',
+    'maven': 'from log_parser.parsers.maven import parse_log_maven',
+}
+
+PARSER_FUNCTIONS = {
+    'jest': 'parse_log_jest(log)',
+    'mocha': 'parse_log_mocha(log)',
+    'pytest': 'parse_log_pytest(log)',
+    'go_test': 'parse_log_go_test(log)',
+    'cargo': 'parse_log_cargo(log)',
+    'maven': 'parse_log_maven(log)',
+}
+
+
 def get_parser_import_code(parser_name: str) -> str:
     """Generate the import statement for the parser."""
-    parser_imports = {
-        'jest': 'from log_parser.parsers.jest import parse_log_jest',
-        'mocha': 'from log_parser.parsers.mocha import parse_log_mocha',
-        'pytest': 'from log_parser.parsers.pytest import parse_log_pytest',
-        'go_test': 'from log_parser.parsers.go_test import parse_log_go_test',
-        'cargo': 'from log_parser.parsers.cargo import parse_log_cargo',
-        'maven': 'from log_parser.parsers.maven import parse_log_maven',
-    }
-    return parser_imports.get(parser_name, f'# Unknown parser: {parser_name}')
+    return PARSER_IMPORTS.get(parser_name, f'# Unknown parser: {parser_name}')
 
 
 def get_parser_function_call(parser_name: str) -> str:
     """Generate the parser function call."""
-    parser_functions = {
-        'jest': 'parse_log_jest(log)',
-        'mocha': 'parse_log_mocha(log)',
-        'pytest': 'parse_log_pytest(log)',
-        'go_test': 'parse_log_go_test(log)',
-        'cargo': 'parse_log_cargo(log)',
-        'maven': 'parse_log_maven(log)',
-    }
-    return parser_functions.get(parser_name, 'return {}  # Unknown parser')
+    return PARSER_FUNCTIONS.get(parser_name, 'return {}  # Unknown parser')
 
 
 def generate_python_profile_class(owner: str, repo: str, metadata: Dict[str, Any],
@@ -443,8 +449,7 @@ def generate_javascript_profile_class(owner: str, repo: str, metadata: Dict[str,
     # Format dockerfile content for SWE-smith style
     if dockerfile_content:
         # Clean up dockerfile content for proper formatting
-        dockerfile_lines = dockerfile_content.strip().split('\n')
-        dockerfile_str = '\n'.join(dockerfile_lines)
+        dockerfile_str = dockerfile_content.strip()
     else:
         dockerfile_str = f'''FROM node:18-slim
 RUN apt-get update && apt-get install -y git && rm -rf /var/lib/apt/lists/*
@@ -17,12 +17,20 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import argparse
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
 
 @dataclass
 class RepoInfo:
     """Data structure for repository information"""
+
+    __slots__ = (
+        'id', 'name', 'full_name', 'owner', 'description', 'language',
+        'stars', 'forks', 'watchers', 'open_issues', 'created_at',
+        'updated_at', 'pushed_at', 'size', 'license', 'url', 'clone_url',
+        'topics',
+    )
+
     id: int
     name: str
     full_name: str
@@ -207,7 +215,7 @@ def save_to_csv(repos: List[RepoInfo], filename: str):
         return
     
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = list(asdict(repos[0]).keys())
+        fieldnames = [f.name for f in fields(RepoInfo)]
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         
         writer.writeheader()
@@ -9,6 +9,7 @@ test case to status mapping.
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -18,6 +19,7 @@ from parsers.pytest import parse_log_pytest
 from parsers.go_test import parse_log_go_test
 from parsers.cargo import parse_log_cargo
 from parsers.maven import parse_log_maven
+from parsers import PARSER_FINGERPRINTS
 
 
 # Parser registry
@@ -78,6 +80,10 @@ def try_parsers(log_content: str, parser_names: List[str]) -> Optional[Tuple[Dic
         if parser_name not in PARSERS:
             continue
             
+        markers = PARSER_FINGERPRINTS.get(parser_name)
+        if markers and not any(marker in log_content for marker in markers):
+            continue
+
         parser_func = PARSERS[parser_name]
         try:
             result = parser_func(log_content)
@@ -100,9 +106,14 @@ def save_parsed_result(result: Dict[str, str], parser_name: str, dockerfile_dir:
         "parsed_test_status": result,
     }
     
+    # Encode the whole document up front and write it in one call; json.dump
+    # would issue a separate write for every encoded fragment. Binary mode
+    # skips the text layer's per-write newline translation.
+    content = json.dumps(output_data, indent=2, ensure_ascii=False).encode('utf-8')
+
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(content)
         print(f"Saved parsed test results to: {output_path}")
     except IOError as e:
         print(f"Error saving parsed test results: {e}")
@@ -191,9 +202,10 @@ def main():
         
         # Summary first
         total = len(result)
-        passed = sum(1 for status in result.values() if status == "PASSED")
-        failed = sum(1 for status in result.values() if status == "FAILED") 
-        skipped = sum(1 for status in result.values() if status == "SKIPPED")
+        status_counts = Counter(result.values())
+        passed = status_counts["PASSED"]
+        failed = status_counts["FAILED"]
+        skipped = status_counts["SKIPPED"]
         
         print(f"\n=== Summary ===")
         print(f"Total tests: {total}")
@@ -1,3 +1,21 @@
 """
 Individual test framework parsers.
-"""
\ No newline at end of file
+"""
+
+from .jest import FINGERPRINTS as JEST_FINGERPRINTS
+from .pytest import FINGERPRINTS as PYTEST_FINGERPRINTS
+from .go_test import FINGERPRINTS as GO_TEST_FINGERPRINTS
+from .cargo import FINGERPRINTS as CARGO_FINGERPRINTS
+from .maven import FINGERPRINTS as MAVEN_FINGERPRINTS
+
+# Substrings at least one of which appears in every log a parser can extract
+# results from. Callers skip a parser when none of its markers is present
+# instead of scanning the whole log. Mocha's result markers are too generic
+# to rule anything out, so it has no entry.
+PARSER_FINGERPRINTS = {
+    'jest': JEST_FINGERPRINTS,
+    'pytest': PYTEST_FINGERPRINTS,
+    'go_test': GO_TEST_FINGERPRINTS,
+    'cargo': CARGO_FINGERPRINTS,
+    'maven': MAVEN_FINGERPRINTS,
+}
@@ -10,6 +10,22 @@ class TestStatus(Enum):
     FAILED = "FAILED" 
     SKIPPED = "SKIPPED"
 
+# Cargo outcome to test status
+STATUS_MAP = {
+    "ok": TestStatus.PASSED.value,
+    "FAILED": TestStatus.FAILED.value,
+    "ignored": TestStatus.SKIPPED.value,
+}
+
+# Pattern for cargo test output
+TEST_PATTERN = re.compile(r"^test\s+(\S+)\s+\.\.\.\s+(ok|FAILED|ignored)$")
+
+# Pattern for doctests
+DOCTEST_PATTERN = re.compile(r"^test\s+\S+\s+-\s+(\w+)\s+.*\.\.\.\s+(ok|FAILED)$")
+
+# Every test and doctest result line has "..." before its status
+FINGERPRINTS = ("...",)
+
 def parse_log_cargo(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with cargo test.
@@ -20,43 +36,36 @@ def parse_log_cargo(log: str) -> dict[str, str]:
         dict: test case to test status mapping
     """
     test_status_map = {}
+    # Doctest results are kept apart and appended after the unit tests
+    doctest_status_map = {}
 
     # Pattern for cargo test output
     # Examples:
     # "test test_function ... ok"
     # "test test_function ... FAILED"
     # "test test_function ... ignored"
-    
-    test_pattern = r"^test\s+(\S+)\s+\.\.\.\s+(ok|FAILED|ignored)$"
-    
-    for line in log.split("\n"):
-        line = line.strip()
-        match = re.match(test_pattern, line)
-        if match:
-            test_name, status = match.groups()
-            
-            if status == "ok":
-                test_status_map[test_name] = TestStatus.PASSED.value
-            elif status == "FAILED":
-                test_status_map[test_name] = TestStatus.FAILED.value
-            elif status == "ignored":
-                test_status_map[test_name] = TestStatus.SKIPPED.value
-
+    #
     # Alternative pattern for doctests
     # "   Doc-tests project_name"
     # "test src/lib.rs - function_name (line X) ... ok"
-    doctest_pattern = r"^test\s+\S+\s+-\s+(\w+)\s+.*\.\.\.\s+(ok|FAILED)$"
     
     for line in log.split("\n"):
+        # Cheap substring check before running the regex
+        if "..." not in line:
+            continue
         line = line.strip()
-        match = re.match(doctest_pattern, line)
+        match = TEST_PATTERN.match(line)
+        if match:
+            test_name, status = match.groups()
+            test_status_map[test_name] = STATUS_MAP[status]
+            continue
+
+        match = DOCTEST_PATTERN.match(line)
         if match:
             test_name, status = match.groups()
             test_name = f"doctest_{test_name}"
-            
-            if status == "ok":
-                test_status_map[test_name] = TestStatus.PASSED.value
-            elif status == "FAILED":
-                test_status_map[test_name] = TestStatus.FAILED.value
+            doctest_status_map[test_name] = STATUS_MAP[status]
+
+    test_status_map.update(doctest_status_map)
 
     return test_status_map
\ No newline at end of file
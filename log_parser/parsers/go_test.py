@@ -10,6 +10,25 @@ class TestStatus(Enum):
     FAILED = "FAILED" 
     SKIPPED = "SKIPPED"
 
+# Go test outcome to test status
+STATUS_MAP = {
+    "PASS": TestStatus.PASSED.value,
+    "FAIL": TestStatus.FAILED.value,
+    "SKIP": TestStatus.SKIPPED.value,
+}
+
+# Test result line; indented lines with a "/" in the name are subtests
+# Examples:
+# "--- PASS: TestFunction (0.00s)"
+# "    --- PASS: TestFunction/subtest (0.00s)"
+RESULT_PATTERN = re.compile(
+    r"^(?P<indent>[^\S\n]*)---[^\S\n]+(?P<status>PASS|FAIL|SKIP):[^\S\n]+(?P<name>\w+)(?P<subtest>/[\w/]+)?",
+    re.MULTILINE,
+)
+
+# Every result line starts with "--- PASS:", "--- FAIL:" or "--- SKIP:"
+FINGERPRINTS = ("---",)
+
 def parse_log_go_test(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Go test.
@@ -20,6 +39,8 @@ def parse_log_go_test(log: str) -> dict[str, str]:
         dict: test case to test status mapping
     """
     test_status_map = {}
+    # Subtest results are kept apart and appended after the top-level tests
+    subtest_status_map = {}
 
     # Pattern for Go test verbose output
     # Examples:
@@ -27,39 +48,20 @@ def parse_log_go_test(log: str) -> dict[str, str]:
     # "--- PASS: TestFunction (0.00s)"
     # "--- FAIL: TestFunction (0.00s)"
     # "--- SKIP: TestFunction (0.00s)"
-    
-    result_pattern = r"^---\s+(PASS|FAIL|SKIP):\s+(\w+)(?:\s+\([\d\.]+s\))?.*$"
-    
-    for line in log.split("\n"):
-        line = line.strip()
-        match = re.match(result_pattern, line)
-        if match:
-            status, test_name = match.groups()
-            
-            if status == "PASS":
-                test_status_map[test_name] = TestStatus.PASSED.value
-            elif status == "FAIL":
-                test_status_map[test_name] = TestStatus.FAILED.value
-            elif status == "SKIP":
-                test_status_map[test_name] = TestStatus.SKIPPED.value
-
-    # Alternative pattern for table tests or subtests
     # "    --- PASS: TestFunction/subtest (0.00s)"
-    subtest_pattern = r"^\s+---\s+(PASS|FAIL|SKIP):\s+(\w+/[\w/]+)(?:\s+\([\d\.]+s\))?.*$"
     
-    for line in log.split("\n"):
-        line_stripped = line.strip()
-        match = re.match(subtest_pattern, line)
-        if match:
-            status, test_name = match.groups()
+    for match in RESULT_PATTERN.finditer(log):
+        status = STATUS_MAP[match.group("status")]
+
+        # The top-level name is recorded for every result line, subtests included
+        test_status_map[match.group("name")] = status
+
+        # Alternative pattern for table tests or subtests
+        if match.group("indent") and match.group("subtest"):
             # Clean up the subtest name
-            test_name = test_name.replace("/", ".")
-            
-            if status == "PASS":
-                test_status_map[test_name] = TestStatus.PASSED.value
-            elif status == "FAIL":
-                test_status_map[test_name] = TestStatus.FAILED.value
-            elif status == "SKIP":
-                test_status_map[test_name] = TestStatus.SKIPPED.value
+            test_name = (match.group("name") + match.group("subtest")).replace("/", ".")
+            subtest_status_map[test_name] = status
+
+    test_status_map.update(subtest_status_map)
 
     return test_status_map
\ No newline at end of file
@@ -10,6 +10,35 @@ class TestStatus(Enum):
     FAILED = "FAILED" 
     SKIPPED = "SKIPPED"
 
+# Verbose result symbol to test status
+SYMBOL_STATUS_MAP = {
+    "✓": TestStatus.PASSED.value,
+    "✕": TestStatus.FAILED.value,
+    "○": TestStatus.SKIPPED.value,
+}
+
+# Summary keyword to test status
+SUMMARY_STATUS_MAP = {
+    "PASS": TestStatus.PASSED.value,
+    "FAIL": TestStatus.FAILED.value,
+    "SKIP": TestStatus.SKIPPED.value,
+}
+
+# Patterns for Jest verbose output with checkmarks/crosses. Lines with and
+# without a trailing duration are matched separately so a greedy name never
+# has to backtrack against an optional duration group.
+VERBOSE_DURATION_PATTERN = re.compile(r"^\s*([✓✕○])\s(.+)\s\((\d+\s*m?s)\)$")
+VERBOSE_PATTERN = re.compile(r"^\s*([✓✕○])\s(.+)$")
+
+# Patterns for "PASS/FAIL filename" or "PASS/FAIL test description". The
+# name starts at the first non-whitespace character so ``\s+`` cannot give
+# back spaces to form a whitespace-only name.
+SUMMARY_DURATION_PATTERN = re.compile(r"^\s*(PASS|FAIL|SKIP)\s+(\S.*)\s\((\d+\.\d+\s*s?)\)$")
+SUMMARY_PATTERN = re.compile(r"^\s*(PASS|FAIL|SKIP)\s+(.+)$")
+
+# Verbose results start with a symbol, summary results with a status word
+FINGERPRINTS = ("✓", "✕", "○", "PASS", "FAIL", "SKIP")
+
 def parse_log_jest(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Jest. Assumes --verbose flag.
@@ -20,34 +49,28 @@ def parse_log_jest(log: str) -> dict[str, str]:
         dict: test case to test status mapping
     """
     test_status_map = {}
-
-    # Pattern for Jest verbose output with checkmarks/crosses
-    pattern = r"^\s*(✓|✕|○)\s(.+?)(?:\s\((\d+\s*m?s)\))?$"
+    # Summary results, only used when no verbose results are found
+    summary_status_map = {}
 
     for line in log.split("\n"):
-        match = re.match(pattern, line.strip())
-        if match:
-            status_symbol, test_name, _duration = match.groups()
-            if status_symbol == "✓":
-                test_status_map[test_name] = TestStatus.PASSED.value
-            elif status_symbol == "✕":
-                test_status_map[test_name] = TestStatus.FAILED.value
-            elif status_symbol == "○":
-                test_status_map[test_name] = TestStatus.SKIPPED.value
-
-    # Alternative pattern for Jest summary format
-    if not test_status_map:
-        # Pattern for "PASS/FAIL filename" or "PASS/FAIL test description"
-        summary_pattern = r"^\s*(PASS|FAIL|SKIP)\s+(.+?)(?:\s\((\d+\.\d+\s*s?)\))?$"
-        for line in log.split("\n"):
-            match = re.match(summary_pattern, line.strip())
+        # Cheap substring checks before running the regexes
+        if "✓" in line or "✕" in line or "○" in line:
+            stripped = line.strip()
+            match = VERBOSE_DURATION_PATTERN.match(stripped) or VERBOSE_PATTERN.match(stripped)
+            if match:
+                status_symbol, test_name = match.group(1, 2)
+                test_status_map[test_name] = SYMBOL_STATUS_MAP[status_symbol]
+                continue
+
+        # Alternative pattern for Jest summary format
+        if not test_status_map and ("PASS" in line or "FAIL" in line or "SKIP" in line):
+            stripped = line.strip()
+            match = SUMMARY_DURATION_PATTERN.match(stripped) or SUMMARY_PATTERN.match(stripped)
             if match:
-                status, test_name, _duration = match.groups()
-                if status == "PASS":
-                    test_status_map[test_name] = TestStatus.PASSED.value
-                elif status == "FAIL":
-                    test_status_map[test_name] = TestStatus.FAILED.value
-                elif status == "SKIP":
-                    test_status_map[test_name] = TestStatus.SKIPPED.value
+                status, test_name = match.group(1, 2)
+                summary_status_map[test_name] = SUMMARY_STATUS_MAP[status]
+
+    if not test_status_map:
+        test_status_map = summary_status_map
 
     return test_status_map
\ No newline at end of file
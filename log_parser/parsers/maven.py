@@ -10,6 +10,51 @@ class TestStatus(Enum):
     FAILED = "FAILED" 
     SKIPPED = "SKIPPED"
 
+# Surefire failure marker (None when the method passed) to test status
+SUREFIRE_STATUS_MAP = {
+    None: TestStatus.PASSED.value,
+    "FAILURE": TestStatus.FAILED.value,
+    "ERROR": TestStatus.FAILED.value,
+}
+
+# JUnit-style outcome to test status
+JUNIT_STATUS_MAP = {
+    "PASS": TestStatus.PASSED.value,
+    "FAIL": TestStatus.FAILED.value,
+    "SKIP": TestStatus.SKIPPED.value,
+}
+
+# Gradle outcome to test status
+GRADLE_STATUS_MAP = {
+    "PASSED": TestStatus.PASSED.value,
+    "FAILED": TestStatus.FAILED.value,
+    "SKIPPED": TestStatus.SKIPPED.value,
+}
+
+# Maven Surefire output: a test class header or an individual test method result
+# Examples:
+# "Running com.example.TestClass"
+# "testMethodName(com.example.TestClass)  Time elapsed: 0.001 sec  <<< FAILURE!"
+# Trailing whitespace is consumed inside each branch so that no lazy group is
+# followed by an open-ended whitespace run, which backtracks quadratically.
+SUREFIRE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:"
+    r"Running[^\S\n]+(?P<class_name>\S(?:.*\S)?)[^\S\n]*"
+    r"|(?P<method_name>\w+)\([^)\n]+\)[^\S\n]+Time elapsed:.*?(?:<<<[^\S\n]+(?P<failure>FAILURE|ERROR)![^\S\n]*)?"
+    r")$",
+    re.MULTILINE,
+)
+
+# JUnit-style console output
+JUNIT_PATTERN = re.compile(r"^\s*(PASS|FAIL|SKIP).*?(\w+\.\w+).*$")
+
+# Gradle test output, e.g. "com.example.TestClass > testMethod PASSED"
+GRADLE_PATTERN = re.compile(r"^(.+?)\s+>\s+(\w+)\s+(PASSED|FAILED|SKIPPED)$")
+
+# Surefire results report "Time elapsed:"; JUnit-style and Gradle results
+# carry a PASS/FAIL/SKIP status word
+FINGERPRINTS = ("Time elapsed:", "PASS", "FAIL", "SKIP")
+
 def parse_log_maven(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Maven or Gradle.
@@ -29,62 +74,47 @@ def parse_log_maven(log: str) -> dict[str, str]:
     # First, look for individual test methods in verbose output
     # "testMethodName(com.example.TestClass)  Time elapsed: 0.001 sec"
     # "testMethodName(com.example.TestClass)  Time elapsed: 0.001 sec  <<< FAILURE!"
-    method_pattern = r"^(\w+)\([^)]+\)\s+Time elapsed:.*?(?:<<<\s+(FAILURE|ERROR)!)?$"
-    
     current_class = None
     
-    for line in log.split("\n"):
-        line = line.strip()
-        
-        # Track current test class
-        class_match = re.match(r"^Running\s+(.+)$", line)
-        if class_match:
-            current_class = class_match.group(1)
-            continue
-            
-        # Parse individual test methods
-        method_match = re.match(method_pattern, line)
-        if method_match:
-            method_name = method_match.group(1)
-            failure_indicator = method_match.group(2)
-            
+    # Every method result carries "Time elapsed:", so a log without it can
+    # only hold class headers and the scan is skipped
+    if "Time elapsed:" in log:
+        for match in SUREFIRE_PATTERN.finditer(log):
+            # Track current test class
+            if match.group("class_name"):
+                current_class = match.group("class_name")
+                continue
+
+            # Parse individual test methods
+            method_name = match.group("method_name")
             test_name = f"{current_class}.{method_name}" if current_class else method_name
-            
-            if failure_indicator:
-                test_status_map[test_name] = TestStatus.FAILED.value
-            else:
-                test_status_map[test_name] = TestStatus.PASSED.value
+            test_status_map[test_name] = SUREFIRE_STATUS_MAP[match.group("failure")]
 
     # Alternative pattern for JUnit-style output
     if not test_status_map:
         # Look for JUnit XML-style patterns in console output
-        junit_pattern = r"^\s*(PASS|FAIL|SKIP).*?(\w+\.\w+).*$"
         for line in log.split("\n"):
-            match = re.match(junit_pattern, line.strip())
+            line = line.strip()
+            # Result lines lead with their status, so anything else can be skipped
+            if not line.startswith(("PASS", "FAIL", "SKIP")):
+                continue
+            match = JUNIT_PATTERN.match(line)
             if match:
                 status, test_name = match.groups()
-                if status == "PASS":
-                    test_status_map[test_name] = TestStatus.PASSED.value
-                elif status == "FAIL":
-                    test_status_map[test_name] = TestStatus.FAILED.value
-                elif status == "SKIP":
-                    test_status_map[test_name] = TestStatus.SKIPPED.value
+                test_status_map[test_name] = JUNIT_STATUS_MAP[status]
 
     # Gradle test output pattern
     if not test_status_map:
         # "com.example.TestClass > testMethod PASSED"
-        gradle_pattern = r"^(.+?)\s+>\s+(\w+)\s+(PASSED|FAILED|SKIPPED)$"
         for line in log.split("\n"):
-            match = re.match(gradle_pattern, line.strip())
+            line = line.strip()
+            # Result lines end with their status, so anything else can be skipped
+            if not line.endswith(("PASSED", "FAILED", "SKIPPED")):
+                continue
+            match = GRADLE_PATTERN.match(line)
             if match:
                 class_name, method_name, status = match.groups()
                 test_name = f"{class_name}.{method_name}"
-                
-                if status == "PASSED":
-                    test_status_map[test_name] = TestStatus.PASSED.value
-                elif status == "FAILED":
-                    test_status_map[test_name] = TestStatus.FAILED.value
-                elif status == "SKIPPED":
-                    test_status_map[test_name] = TestStatus.SKIPPED.value
+                test_status_map[test_name] = GRADLE_STATUS_MAP[status]
 
     return test_status_map
\ No newline at end of file
@@ -10,6 +10,33 @@ class TestStatus(Enum):
     FAILED = "FAILED" 
     SKIPPED = "SKIPPED"
 
+# Mocha result line; the named group that matched gives the status. Whitespace
+# around the name is matched outside the name groups, so names need no strip().
+# Names start and end with a non-whitespace character, so a whitespace run is
+# only ever tried once as the name's tail.
+RESULT_PATTERN = re.compile(
+    r"^[^\S\n]*(?:"
+    r"[✓✔][^\S\n]+(?P<passed>\S(?:.*?\S)??)(?:[^\S\n]+\(\d+[^\S\n]*m?s\))?"  # passing, with either checkmark
+    r"|\d+\)[^\S\n]+(?P<failed>\S(?:.*\S)?)"  # failing, numbered like "1) test name"
+    r"|-[^\S\n]+(?P<skipped>\S(?:.*\S)?)"  # pending
+    r"|(?P<tap_status>ok|not ok)[^\S\n]+\d+[^\S\n]+(?P<tap>\S(?:.*\S)?)"  # TAP reporter, e.g. "ok 1 test name"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Matched group name to test status
+STATUS_MAP = {
+    "passed": TestStatus.PASSED.value,
+    "failed": TestStatus.FAILED.value,
+    "skipped": TestStatus.SKIPPED.value,
+}
+
+# TAP outcome to test status
+TAP_STATUS_MAP = {
+    "ok": TestStatus.PASSED.value,
+    "not ok": TestStatus.FAILED.value,
+}
+
 def parse_log_mocha(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Mocha.
@@ -20,6 +47,8 @@ def parse_log_mocha(log: str) -> dict[str, str]:
         dict: test case to test status mapping
     """
     test_status_map = {}
+    # TAP results, only used when no spec reporter results are found
+    tap_status_map = {}
 
     # Pattern for Mocha spec reporter format
     # Examples:
@@ -27,40 +56,15 @@ def parse_log_mocha(log: str) -> dict[str, str]:
     # "    1) should fail something"
     # "    - should skip something"
     
-    for line in log.split("\n"):
-        line = line.strip()
-        
-        # Passing tests (support both ✓ and ✔ checkmarks)
-        pass_match = re.match(r"^\s*[✓✔]\s+(.+?)(?:\s+\((\d+\s*m?s)\))?$", line)
-        if pass_match:
-            test_name = pass_match.group(1).strip()
-            test_status_map[test_name] = TestStatus.PASSED.value
-            continue
-            
-        # Failing tests - pattern like "1) test name"
-        fail_match = re.match(r"^\s*\d+\)\s+(.+)$", line)
-        if fail_match:
-            test_name = fail_match.group(1).strip()
-            test_status_map[test_name] = TestStatus.FAILED.value
-            continue
-            
-        # Skipped tests
-        skip_match = re.match(r"^\s*-\s+(.+)$", line)
-        if skip_match:
-            test_name = skip_match.group(1).strip()
-            test_status_map[test_name] = TestStatus.SKIPPED.value
-            continue
+    for match in RESULT_PATTERN.finditer(log):
+        kind = match.lastgroup
+        if kind != "tap":
+            test_status_map[match.group(kind)] = STATUS_MAP[kind]
+        elif not test_status_map:
+            # Alternative pattern for TAP output from Mocha
+            tap_status_map[match.group("tap")] = TAP_STATUS_MAP[match.group("tap_status")]
 
-    # Alternative pattern for TAP output from Mocha
     if not test_status_map:
-        tap_pattern = r"^(ok|not ok)\s+\d+\s+(.+)$"
-        for line in log.split("\n"):
-            match = re.match(tap_pattern, line.strip())
-            if match:
-                status, test_name = match.groups()
-                if status == "ok":
-                    test_status_map[test_name] = TestStatus.PASSED.value
-                else:
-                    test_status_map[test_name] = TestStatus.FAILED.value
+        test_status_map = tap_status_map
 
     return test_status_map
\ No newline at end of file
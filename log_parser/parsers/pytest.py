@@ -10,6 +10,31 @@ class TestStatus(Enum):
     FAILED = "FAILED" 
     SKIPPED = "SKIPPED"
 
+# Pytest outcome to test status; ERROR counts as a failure
+STATUS_MAP = {
+    "PASSED": TestStatus.PASSED.value,
+    "FAILED": TestStatus.FAILED.value,
+    "ERROR": TestStatus.FAILED.value,
+    "SKIPPED": TestStatus.SKIPPED.value,
+}
+
+# Combined pattern for a single pass over the log. The first alternative
+# matches pytest verbose output, the second the short test summary info.
+# Examples:
+# "test_file.py::test_function PASSED"
+# "test_file.py::TestClass::test_method FAILED"
+# "test_file.py::test_skip SKIPPED"
+# "FAILED test_file.py::test_function - assert 1 == 2"
+LINE_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<file_part>.+?)::(?P<test_part>[\w_]+)(?:::(?P<test_method>[\w_]+))?\s+(?P<status>PASSED|FAILED|SKIPPED|ERROR)(?:\s+\[.*?\])?"
+    r"|(?P<summary_status>FAILED|PASSED|SKIPPED)\s+(?P<summary_name>.+?)(?:\s+-\s+.*)?"
+    r")$"
+)
+
+# Status words that verbose and short-summary result lines end or start with
+FINGERPRINTS = ("PASSED", "FAILED", "SKIPPED", "ERROR")
+
 def parse_log_pytest(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with pytest.
@@ -20,48 +45,36 @@ def parse_log_pytest(log: str) -> dict[str, str]:
         dict: test case to test status mapping
     """
     test_status_map = {}
+    # Results from the short test summary, only used if no verbose lines matched
+    summary_status_map = {}
 
-    # Pattern for pytest verbose output
-    # Examples:
-    # "test_file.py::test_function PASSED"
-    # "test_file.py::TestClass::test_method FAILED"
-    # "test_file.py::test_skip SKIPPED"
-    
-    verbose_pattern = r"^(.+?)::([\w_]+(?:::[\w_]+)?)\s+(PASSED|FAILED|SKIPPED|ERROR)(?:\s+\[.*?\])?$"
-    
     for line in log.split("\n"):
-        line = line.strip()
-        match = re.match(verbose_pattern, line)
-        if match:
-            file_part, test_part, status = match.groups()
-            
+        # Every result line carries a status word; skip the rest before
+        # stripping and matching
+        if not any(status in line for status in FINGERPRINTS):
+            continue
+        match = LINE_PATTERN.match(line.strip())
+        if not match:
+            continue
+
+        status = match.group("status")
+        if status:
+            test_part, test_method = match.group("test_part", "test_method")
+
             # Create a readable test name
-            if "::" in test_part:
+            if test_method:
                 # Format: TestClass::test_method -> TestClass.test_method
-                test_name = test_part.replace("::", ".")
+                test_name = f"{test_part}.{test_method}"
             else:
                 test_name = test_part
-                
-            if status in ["PASSED"]:
-                test_status_map[test_name] = TestStatus.PASSED.value
-            elif status in ["FAILED", "ERROR"]:
-                test_status_map[test_name] = TestStatus.FAILED.value
-            elif status in ["SKIPPED"]:
-                test_status_map[test_name] = TestStatus.SKIPPED.value
+
+            test_status_map[test_name] = STATUS_MAP[status]
+        elif not test_status_map:
+            test_name = match.group("summary_name")
+            summary_status_map[test_name] = STATUS_MAP[match.group("summary_status")]
 
     # Alternative pattern for dot notation output
     if not test_status_map:
-        # Look for short test summary info
-        summary_pattern = r"^(FAILED|PASSED|SKIPPED)\s+(.+?)(?:\s+-\s+.*)?$"
-        for line in log.split("\n"):
-            match = re.match(summary_pattern, line.strip())
-            if match:
-                status, test_name = match.groups()
-                if status == "PASSED":
-                    test_status_map[test_name] = TestStatus.PASSED.value
-                elif status == "FAILED":
-                    test_status_map[test_name] = TestStatus.FAILED.value
-                elif status == "SKIPPED":
-                    test_status_map[test_name] = TestStatus.SKIPPED.value
+        test_status_map = summary_status_map
 
-    return test_status_map
\ No newline at end of file
+    return test_status_map
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test edge cases and additional verbose formats."""
 
+import time
+
 from log_parser.parsers.pytest import parse_log_pytest
 from log_parser.parsers.jest import parse_log_jest
 from log_parser.parsers.mocha import parse_log_mocha
@@ -170,6 +172,40 @@ testCacheInvalidation(com.example.IntegrationTest)  Time elapsed: 0.156 sec  <<<
 Tests run: 3, Failures: 1, Errors: 0, Skipped: 0, Time elapsed: 0.933 sec <<< FAILURE!
 """
 
+# Pytest output with CRLF line endings and trailing whitespace
+pytest_crlf_log = (
+    "test_app.py::test_index PASSED \r\n"
+    "test_app.py::TestApi::test_get FAILED\t\r\n"
+    "  ::test_orphan PASSED\r\n"
+    "PASSED \r\n"
+    "PASSED\t\t\r\n"
+)
+
+# Short test summary with whitespace-only names around a real result
+pytest_summary_whitespace_log = "PASSED\t\t\nFAILED test_app.py::test_index - boom \r\n"
+
+# Jest summary lines whose only text after the status is a duration
+jest_duration_only_log = "PASS   (1.2 s)\nFAIL \r (0.00s)\nPASS src/app.test.js (2.5 s)\n"
+
+# Maven Surefire output with CRLF endings and a long whitespace-padded line
+maven_crlf_log = (
+    "Running com.example.MathTest \r\n"
+    "testAdd(com.example.MathTest)  Time elapsed: 0.001 sec\r\n"
+    "testDiv(com.example.MathTest)  Time elapsed: 0.002 sec  <<< FAILURE!\t\r\n"
+)
+maven_long_whitespace_log = (
+    "testSlow(com.example.MathTest) Time elapsed:" + " " * 20000 + "<<<" + " " * 20000 + "x\n"
+)
+
+# Mocha output with CRLF endings, padded names and a long whitespace-padded line
+mocha_crlf_log = (
+    "  ✓ adds numbers  (5 ms) \r\n"
+    "  ✔ subtracts numbers\t\r\n"
+    "  1) divides by zero \r\n"
+    "  - multiplies later  \r\n"
+)
+mocha_long_whitespace_log = "  ✓ a" + " " * 20000 + "b\n  1) c" + " " * 20000 + "d\n"
+
 def test_edge_cases():
     """Test edge cases and additional verbose formats."""
     
@@ -242,5 +278,70 @@ def test_edge_cases():
     else:
         print("   ✗ Failed to parse")
 
+    # Test pytest with CRLF line endings and trailing whitespace
+    print("\n7. Testing pytest with CRLF line endings and trailing whitespace")
+    result = parse_log_pytest(pytest_crlf_log)
+    expected = {"test_index": "PASSED", "TestApi.test_get": "FAILED"}
+    if result == expected:
+        print(f"   ✓ Parsed {len(result)} tests without whitespace-only names")
+    else:
+        print(f"   ✗ Expected {expected}, got {result}")
+
+    result = parse_log_pytest(pytest_summary_whitespace_log)
+    expected = {"test_app.py::test_index": "FAILED"}
+    if result == expected:
+        print("   ✓ Ignored whitespace-only summary names")
+    else:
+        print(f"   ✗ Expected {expected}, got {result}")
+
+    # Test jest summary lines with nothing but a duration after the status
+    print("\n8. Testing jest summary lines with only a duration")
+    result = parse_log_jest(jest_duration_only_log)
+    expected = {"(1.2 s)": "PASSED", "(0.00s)": "FAILED", "src/app.test.js": "PASSED"}
+    if result == expected:
+        print("   ✓ Kept the duration text instead of a whitespace-only name")
+    else:
+        print(f"   ✗ Expected {expected}, got {result}")
+
+    # Test maven with CRLF line endings and long whitespace runs
+    print("\n9. Testing maven with CRLF line endings and long whitespace runs")
+    result = parse_log_maven(maven_crlf_log)
+    expected = {"com.example.MathTest.testAdd": "PASSED", "com.example.MathTest.testDiv": "FAILED"}
+    if result == expected:
+        print(f"   ✓ Parsed {len(result)} tests with CRLF line endings")
+    else:
+        print(f"   ✗ Expected {expected}, got {result}")
+
+    start = time.perf_counter()
+    result = parse_log_maven(maven_long_whitespace_log)
+    elapsed = time.perf_counter() - start
+    if result == {"testSlow": "PASSED"} and elapsed < 0.5:
+        print(f"   ✓ Parsed a 40k-character line in {elapsed:.3f}s")
+    else:
+        print(f"   ✗ Got {result} in {elapsed:.3f}s")
+
+    # Test mocha with CRLF line endings and long whitespace runs
+    print("\n10. Testing mocha with CRLF line endings and long whitespace runs")
+    result = parse_log_mocha(mocha_crlf_log)
+    expected = {
+        "adds numbers": "PASSED",
+        "subtracts numbers": "PASSED",
+        "divides by zero": "FAILED",
+        "multiplies later": "SKIPPED",
+    }
+    if result == expected:
+        print(f"   ✓ Parsed {len(result)} tests without trailing whitespace")
+    else:
+        print(f"   ✗ Expected {expected}, got {result}")
+
+    start = time.perf_counter()
+    result = parse_log_mocha(mocha_long_whitespace_log)
+    elapsed = time.perf_counter() - start
+    expected = {"a" + " " * 20000 + "b": "PASSED", "c" + " " * 20000 + "d": "FAILED"}
+    if result == expected and elapsed < 0.5:
+        print(f"   ✓ Parsed 20k-character lines in {elapsed:.3f}s")
+    else:
+        print(f"   ✗ Got {len(result)} tests in {elapsed:.3f}s")
+
 if __name__ == "__main__":
     test_edge_cases()
\ No newline at end of file
@@ -18,6 +18,17 @@ from typing import Tuple, Optional, Dict, Any
 import threading
 import time
 
+# Summary counts, e.g. "12 passing" (mocha) or "3 failed" (pytest)
+MOCHA_COUNT_PATTERN = re.compile(r'(\d+)\s+(passing|failing|pending)')
+PYTEST_COUNT_PATTERN = re.compile(r'(\d+)\s+(passed|failed|error|skipped)', re.IGNORECASE)
+CHECKMARK_PATTERN = re.compile(r'[✔✓]')
+CROSS_PATTERN = re.compile(r'[✗✖×]')
+
+# Jest summary line, e.g. "Tests:       1 failed, 4 passed, 5 total"
+JEST_PASSED_PATTERN = re.compile(r'Tests:\s+(\d+)\s+passed')
+JEST_FAILED_PATTERN = re.compile(r'Tests:\s+(\d+)\s+failed')
+JEST_TOTAL_PATTERN = re.compile(r'Tests:.*?(\d+)\s+total')
+
 def run_command(cmd: list, cwd: Optional[Path] = None, timeout: int = 300) -> Tuple[int, str]:
     """Run a command and return exit code and output."""
     try:
@@ -86,36 +97,38 @@ def parse_test_results(output: str, test_framework: str = None) -> Dict[str, Any
 
     # Try to detect test framework if not provided
     if not test_framework:
-        if 'mocha' in output.lower() or '✔' in output or '✓' in output:
+        # Lowercase once and reuse it for every probe
+        output_lower = output.lower()
+        if 'mocha' in output_lower or '✔' in output or '✓' in output:
             test_framework = 'mocha'
-        elif 'jest' in output.lower() or 'PASS' in output or 'FAIL' in output:
+        elif 'jest' in output_lower or 'PASS' in output or 'FAIL' in output:
             test_framework = 'jest'
-        elif 'pytest' in output.lower() or 'passed' in output.lower():
+        elif 'pytest' in output_lower or 'passed' in output_lower:
             test_framework = 'pytest'
-        elif 'npm test' in output.lower():
+        elif 'npm test' in output_lower:
             test_framework = 'npm'
 
     # Parse based on framework
     if test_framework in ['mocha', 'npm']:
-        # Look for mocha-style output: "X passing"
-        passing_match = re.search(r'(\d+)\s+passing', output)
-        failing_match = re.search(r'(\d+)\s+failing', output)
-        pending_match = re.search(r'(\d+)\s+pending', output)
+        # Look for mocha-style output: "X passing", keeping the first count of each kind
+        counts = {}
+        for match in MOCHA_COUNT_PATTERN.finditer(output):
+            counts.setdefault(match.group(2), int(match.group(1)))
 
-        if passing_match:
+        if 'passing' in counts:
             result['tests_run'] = True
-            result['passed'] = int(passing_match.group(1))
+            result['passed'] = counts['passing']
 
-        if failing_match:
-            result['failed'] = int(failing_match.group(1))
+        if 'failing' in counts:
+            result['failed'] = counts['failing']
 
-        if pending_match:
-            result['skipped'] = int(pending_match.group(1))
+        if 'pending' in counts:
+            result['skipped'] = counts['pending']
 
         # Count checkmarks as alternative
         if not result['tests_run']:
-            checkmarks = len(re.findall(r'[✔✓]', output))
-            crosses = len(re.findall(r'[✗✖×]', output))
+            checkmarks = len(CHECKMARK_PATTERN.findall(output))
+            crosses = len(CROSS_PATTERN.findall(output))
             if checkmarks > 0 or crosses > 0:
                 result['tests_run'] = True
                 result['passed'] = checkmarks
@@ -123,9 +136,9 @@ def parse_test_results(output: str, test_framework: str = None) -> Dict[str, Any
 
     elif test_framework == 'jest':
         # Look for jest-style output
-        pass_match = re.search(r'Tests:\s+(\d+)\s+passed', output)
-        fail_match = re.search(r'Tests:\s+(\d+)\s+failed', output)
-        total_match = re.search(r'Tests:.*?(\d+)\s+total', output)
+        pass_match = JEST_PASSED_PATTERN.search(output)
+        fail_match = JEST_FAILED_PATTERN.search(output)
+        total_match = JEST_TOTAL_PATTERN.search(output)
 
         if pass_match:
             result['tests_run'] = True
@@ -138,24 +151,24 @@ def parse_test_results(output: str, test_framework: str = None) -> Dict[str, Any
             result['total'] = int(total_match.group(1))
 
     elif test_framework == 'pytest':
-        # Look for pytest-style output
-        summary_match = re.search(r'(\d+)\s+passed', output.lower())
-        failed_match = re.search(r'(\d+)\s+failed', output.lower())
-        error_match = re.search(r'(\d+)\s+error', output.lower())
-        skipped_match = re.search(r'(\d+)\s+skipped', output.lower())
+        # Look for pytest-style output, keeping the first count of each kind.
+        # Other runners print e.g. "10 Passed, 2 Failed", so match any case.
+        counts = {}
+        for match in PYTEST_COUNT_PATTERN.finditer(output):
+            counts.setdefault(match.group(2).lower(), int(match.group(1)))
 
-        if summary_match:
+        if 'passed' in counts:
             result['tests_run'] = True
-            result['passed'] = int(summary_match.group(1))
+            result['passed'] = counts['passed']
 
-        if failed_match:
-            result['failed'] = int(failed_match.group(1))
+        if 'failed' in counts:
+            result['failed'] = counts['failed']
 
-        if error_match:
-            result['errors'] = int(error_match.group(1))
+        if 'error' in counts:
+            result['errors'] = counts['error']
 
-        if skipped_match:
-            result['skipped'] = int(skipped_match.group(1))
+        if 'skipped' in counts:
+            result['skipped'] = counts['skipped']
 
     # Calculate total and success
     result['total'] = result['passed'] + result['failed'] + result['skipped'] + result['errors']
@@ -320,11 +333,12 @@ source {install_script}
             with open(env_yml_path, 'r') as f:
                 lines = f.readlines()
 
+            # Exclude the package by repository name
+            excluded_prefixes = (f"- {repo}==", f"- {repo.lower()}==")
+
             with open(env_yml_path, 'w') as f:
                 for line in lines:
-                    # Exclude the package by repository name
-                    if line.strip().startswith(f"- {repo}==") or \
-                       line.strip().startswith(f"- {repo.lower()}=="):
+                    if line.strip().startswith(excluded_prefixes):
                         continue
                     f.write(line)
         except Exception as e:
@@ -388,7 +402,8 @@ cd {clone_dir}
                 else:
                     print(f"   ⚠️  Command exited with code {exit_code}")
                     # If no tests detected but command failed, consider it a test failure
-                    if 'no test' not in output.lower() and 'not found' not in output.lower():
+                    output_lower = output.lower()
+                    if 'no test' not in output_lower and 'not found' not in output_lower:
                         testing_success = False
 
     # Save test output
@@ -568,10 +583,10 @@ def verify_dockerfile(dockerfile_path: Path, image_name: str = None, show_progre
         print(f"\n💾 Test output saved to {test_output_path.name}")
 
         # Show summary
-        lines = combined_output.split('\n')
-        if len(lines) > 20:
+        # Only the tail is shown, so count lines instead of splitting them all
+        if combined_output.count('\n') >= 20:
             print("\n📋 Test output preview (last 10 lines):")
-            for line in lines[-10:]:
+            for line in combined_output.rsplit('\n', 10)[-10:]:
                 if line.strip():
                     print(f"   {line}")
 
@@ -13,6 +13,7 @@ Usage:
 import json
 import sys
 import argparse
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -23,6 +24,7 @@ from log_parser.parsers.pytest import parse_log_pytest
 from log_parser.parsers.go_test import parse_log_go_test
 from log_parser.parsers.cargo import parse_log_cargo
 from log_parser.parsers.maven import parse_log_maven
+from log_parser.parsers import PARSER_FINGERPRINTS
 
 
 # Parser registry
@@ -99,6 +101,10 @@ def try_parsers(log_content: str, parser_names: List[str]) -> Optional[Tuple[Dic
         if parser_name not in PARSERS:
             continue
 
+        markers = PARSER_FINGERPRINTS.get(parser_name)
+        if markers and not any(marker in log_content for marker in markers):
+            continue
+
         parser_func = PARSERS[parser_name]
         try:
             result = parser_func(log_content)
@@ -121,9 +127,13 @@ def save_parsed_result(result: Dict[str, str], parser_name: str, directory: Path
         "parsed_test_status": result,
     }
 
+    # Encode the whole document up front and write it in one call, as
+    # log_parser/main.py does; json.dump would issue a write per fragment
+    content = json.dumps(output_data, indent=2, ensure_ascii=False).encode('utf-8')
+
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(content)
         print(f"Saved parsed test results to: {output_path}")
     except IOError as e:
         print(f"Error saving parsed test results: {e}")
@@ -280,9 +290,10 @@ def main():
 
         # Summary
         total = len(result)
-        passed = sum(1 for status in result.values() if status == "PASSED")
-        failed = sum(1 for status in result.values() if status == "FAILED")
-        skipped = sum(1 for status in result.values() if status == "SKIPPED")
+        status_counts = Counter(result.values())
+        passed = status_counts["PASSED"]
+        failed = status_counts["FAILED"]
+        skipped = status_counts["SKIPPED"]
 
         print(f"\n📊 Parsing Summary:")
         print(f"   Parser used: {parser_name}")